@@ -1,25 +1,48 @@
+import functools
 import json
 import os
-import time
 import re
+import sys
+import time
 import threading
-import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List, Tuple
 
+# orjson is optional: faster native (de)serialization, UTF-8 in and out.
+# Without it we fall back to the stdlib json module. Output matches for typical data;
+# see the README for edge cases (big ints, float formatting, NaN/Infinity).
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the deployment package
+    orjson = None
+
 # --- Config ---
 # Directories for data and i18n files (relative to working dir)
 DATA_PREFIX = os.environ.get("DATA_PREFIX", "data")
 I18N_PREFIX = os.environ.get("I18N_PREFIX", "i18n")
+# Set to "1" to skip the import-time i18n directory snapshot and always try the file
+# (e.g. when translations are added to a running environment).
+I18N_RESCAN = os.environ.get("I18N_RESCAN", "0") == "1"
+# Eagerly load all i18n files and the units file at import (cold start) instead of
+# on the first request; entries still expire and reload via their TTLs.
+PRELOAD_I18N = os.environ.get("PRELOAD_I18N", "1") == "1"
+# Set to "1" to load cold descriptions / units / data concurrently on a thread pool.
+# Only worth it on slow storage (e.g. EFS): for files packaged with the deployment
+# (page cache, a few microseconds per read) the thread hop costs more than it saves.
+CONCURRENT_COLD_LOADS = os.environ.get("CONCURRENT_COLD_LOADS", "0") == "1"
+# Pool size when CONCURRENT_COLD_LOADS=1; shared by all request threads
+COLD_LOAD_WORKERS = int(os.environ.get("COLD_LOAD_WORKERS", "16"))
 
 # Default language (if no Accept-Language or no match)
 DEFAULT_LANG = os.environ.get("DEFAULT_LANG", "en")
 # Supported languages (comma-separated, e.g., "en,de,fr")
 # Note: DEFAULT_LANG should be in this set.
-SUPPORTED_LANGS = set((os.environ.get("SUPPORTED_LANGS", "en,de,fr")).split(","))
+SUPPORTED_LANGS = frozenset(os.environ.get("SUPPORTED_LANGS", "en,de,fr").split(","))
 
 # Optional canonical ordering for output; comma-separated keys in desired order
 # example: "key2,key1,key3"
-CANON_KEYS = [k for k in os.environ.get("CANON_KEYS", "").split(",") if k]
+CANON_KEYS: Tuple[str, ...] = tuple(k for k in os.environ.get("CANON_KEYS", "").split(",") if k)
 
 # Units file (single global file, language-agnostic)
 UNITS_FILE = os.environ.get("UNITS_FILE", "units/units.json")
@@ -28,39 +51,93 @@ UNITS_FILE = os.environ.get("UNITS_FILE", "units/units.json")
 # Limits for Accept-Language parsing
 MAX_LANG_HEADER_LEN = int(os.environ.get("MAX_LANG_HEADER_LEN", "512"))
 MAX_LANG_ENTRIES = int(os.environ.get("MAX_LANG_ENTRIES", "12"))
+# One Accept-Language element: language range, optional q weight (whitespace allowed
+# around ";" and "="; "q" is case-insensitive per RFC 9110), then anything up to the
+# next comma (other params are ignored).
+_ACCEPT_LANG_RE = re.compile(
+    r"(?:^|,)\s*([^,;\s]*)\s*(?:;\s*q\s*=\s*([^,;\s]*))?[^,]*", re.IGNORECASE
+)
+# Number of distinct Accept-Language headers whose negotiation result is memoized
+LANG_NEGOTIATION_CACHE_SIZE = int(os.environ.get("LANG_NEGOTIATION_CACHE_SIZE", "1024"))
 # Cache TTLs (in seconds)
 DESC_CACHE_TTL_SECONDS = int(os.environ.get("DESC_CACHE_TTL_SECONDS", "1200"))  # 20 min
 DATA_CACHE_TTL_SECONDS = int(os.environ.get("DATA_CACHE_TTL_SECONDS", "600"))  # 10 min
 UNITS_CACHE_TTL_SECONDS = int(os.environ.get("UNITS_CACHE_TTL_SECONDS", "86400"))  # 24 h
+# Same TTLs in nanoseconds, for integer comparisons against time.monotonic_ns()
+_NS_PER_SECOND = 1_000_000_000
+DESC_CACHE_TTL_NS = DESC_CACHE_TTL_SECONDS * _NS_PER_SECOND
+DATA_CACHE_TTL_NS = DATA_CACHE_TTL_SECONDS * _NS_PER_SECOND
+UNITS_CACHE_TTL_NS = UNITS_CACHE_TTL_SECONDS * _NS_PER_SECOND
+# Missing IDs are remembered briefly: min(60s, DATA_CACHE_TTL_SECONDS)
+MISS_CACHE_TTL_NS = min(60, DATA_CACHE_TTL_SECONDS) * _NS_PER_SECOND
 # Bounded cache sizes (reasonable defaults)
 MAX_DATA_CACHE_ENTRIES = int(os.environ.get("MAX_DATA_CACHE_ENTRIES", "1000"))
 MAX_MISS_CACHE_ENTRIES = int(os.environ.get("MAX_MISS_CACHE_ENTRIES", "5000"))
+MAX_RESPONSE_CACHE_ENTRIES = int(os.environ.get("MAX_RESPONSE_CACHE_ENTRIES", "1000"))
+# key orders are shared by items with the same key set, so fewer entries are needed
+MAX_KEYS_CACHE_ENTRIES = int(os.environ.get("MAX_KEYS_CACHE_ENTRIES", "256"))
+MAX_TEMPLATE_CACHE_ENTRIES = int(os.environ.get("MAX_TEMPLATE_CACHE_ENTRIES", "256"))
+# distinct fixed 400/404 (code, message) bodies kept serialized
+ERROR_BODY_CACHE_SIZE = int(os.environ.get("ERROR_BODY_CACHE_SIZE", "64"))
 
 # --- Caches (survive warm invocations) ---
-# We store loaded_at_mono from time.monotonic() for robust TTL math.
-# lang -> {"data": dict, "loaded_at_mono": float}
-_DESC_CACHE: Dict[str, Dict[str, Any]] = {}
-# id -> {"data_map": dict, "loaded_at_mono": float}
-_DATA_CACHE: Dict[str, Dict[str, Any]] = {}
-# singleton -> {"units": dict, "loaded_at_mono": float}
-_UNITS_CACHE: Dict[str, Any] = {}
-# negative cache for missing IDs: id -> expires_at_mono (float)
-_DATA_MISS_CACHE: Dict[str, float] = {}
-
-# --- Locks (thread-safety for cache writes) ---
+# Each cache is a pair of parallel dicts: key -> payload and key -> loaded_at_ns.
+# Stamps come from time.monotonic_ns(): wall clocks can jump (NTP/DST/manual changes),
+# monotonic only increases, so TTL comparisons remain correct; integer nanoseconds
+# avoid float precision loss at large offsets.
+# Writers store the payload before the stamp, so a fresh stamp implies a payload.
+# lang -> descriptions dict / loaded_at_ns
+_DESC_DATA: Dict[str, dict] = {}
+_DESC_STAMP: Dict[str, int] = {}
+# id -> data_map dict / loaded_at_ns
+_DATA_MAPS: Dict[str, dict] = {}
+_DATA_STAMP: Dict[str, int] = {}
+# singleton "units" -> units dict / loaded_at_ns
+_UNITS_DATA: Dict[str, dict] = {}
+_UNITS_STAMP: Dict[str, int] = {}
+# negative cache for missing IDs: id -> expires_at_ns (int), ordered by expiry
+# (fixed TTL + move_to_end on re-insert), so expired entries collect at the front.
+_DATA_MISS_CACHE: "OrderedDict[str, int]" = OrderedDict()
+# serialized 200 bodies: (id, lang, id(descriptions), id(units), id(values)) ->
+#   (descriptions, units, values, body); the source maps are kept referenced so
+#   their id()s cannot be reused while the entry is alive.
+_RESPONSE_CACHE: Dict[tuple, Tuple[dict, dict, dict, str]] = {}
+# output key order: (id(descriptions), frozenset(value keys), id(units)) ->
+#   (descriptions, units, keys); items with the same key set share one keys tuple.
+#   descriptions/units kept referenced as above.
+_KEYS_CACHE: Dict[Tuple[int, frozenset, int], Tuple[dict, dict, Tuple[str, ...]]] = {}
+# value-independent part of list-attribute: (id(descriptions), id(units), keys tuple) ->
+#   (descriptions, units, [(key, description, unit), ...]); the key order is matched by
+#   content, so every item with the same key order shares one template.
+_TEMPLATE_CACHE: Dict[Tuple[int, int, Tuple[str, ...]], Tuple[dict, dict, list]] = {}
+
+# --- Locks (thread-safety for bounded eviction) ---
 # Lambda typically runs single-threaded per runtime, but web servers / tests might not.
-_DESC_LOCK = threading.Lock()
+# Single-key dict writes/pops are atomic under the GIL, so plain writes need no lock;
+# only evict-then-insert in _bounded_put and all negative-cache mutations
+# (multi-step OrderedDict updates) are serialized.
 _DATA_LOCK = threading.Lock()
-_UNITS_LOCK = threading.Lock()
 _MISS_LOCK = threading.Lock()
+_RESPONSE_LOCK = threading.Lock()
+_KEYS_LOCK = threading.Lock()
+_TEMPLATE_LOCK = threading.Lock()
+
+# Opt-in pool for concurrent cold loads (file I/O releases the GIL); threads are
+# only started once a cold request needs them.
+_IO_POOL = (
+    ThreadPoolExecutor(max_workers=COLD_LOAD_WORKERS, thread_name_prefix="cold-load")
+    if CONCURRENT_COLD_LOADS
+    else None
+)
 
 # Response caching control
 # e.g., "no-store", or "public, max-age=300"
 RESPONSE_CACHE_CONTROL = os.environ.get("RESPONSE_CACHE_CONTROL", "public, max-age=300")
 
 # --- ID validation ---
-# exactly 4 characters, lowercase a-z or digits 0-9
-_ID_RE = re.compile(r"^[a-z0-9]{4}$")
+# exactly 4 characters, lowercase a-z or digits 0-9 (set membership beats a regex here)
+_ID_LEN = 4
+_ID_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
 
 
 def _validate_item_id(item_id: str) -> None:
@@ -70,59 +147,153 @@ def _validate_item_id(item_id: str) -> None:
       - only [a-z0-9]
     Blocks path traversal and malformed names by construction.
     """
-    if not isinstance(item_id, str) or not _ID_RE.fullmatch(item_id):
+    if (
+        not isinstance(item_id, str)
+        or len(item_id) != _ID_LEN
+        or not _ID_CHARS.issuperset(item_id)
+    ):
         raise ValueError("invalid id: must be exactly 4 chars [a-z0-9]")
 
 
-# --- Shared cache helper ---
-def cache_fresh(entry: Optional[dict], ttl_seconds: int, now_mono: float) -> bool:
-    """
-    Return True if cache entry exists and is still fresh using a monotonic clock.
-    Why monotonic? Wall clocks can jump (NTP/DST/manual changes); monotonic only increases,
-    so TTL comparisons remain correct.
-    """
-    return bool(entry) and (now_mono - entry.get("loaded_at_mono", -1e18) < ttl_seconds)
-
-
+# --- Shared cache helpers ---
 def _bounded_put(
-    cache: Dict[str, Any], key: str, value: Any, max_entries: int, lock: threading.Lock
+    cache: Dict[Any, Any], key: Any, value: Any, max_entries: int, lock: threading.Lock
 ):
     """
     Insert into a dict-bounded cache; evict an arbitrary oldest entry when full.
     This avoids unbounded growth in long-lived Lambda execution environments.
+    The lock is only taken on the (rare) eviction path.
     """
-    with lock:
-        if len(cache) >= max_entries:
-            cache.pop(next(iter(cache)))
+    if len(cache) >= max_entries:
+        with lock:
+            if len(cache) >= max_entries:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = value
+    else:
         cache[key] = value
 
 
+def _bounded_put_stamped(
+    data: Dict[Any, Any],
+    stamps: Dict[Any, int],
+    key: Any,
+    value: Any,
+    now_ns: int,
+    max_entries: int,
+    lock: threading.Lock,
+):
+    """
+    _bounded_put() for a payload/stamp dict pair: evicts the oldest key from both.
+    The payload is written before the stamp (see cache layout above).
+    """
+    if len(stamps) >= max_entries:
+        with lock:
+            if len(stamps) >= max_entries:
+                oldest = next(iter(stamps))
+                stamps.pop(oldest, None)
+                data.pop(oldest, None)
+            data[key] = value
+            stamps[key] = now_ns
+    else:
+        data[key] = value
+        stamps[key] = now_ns
+
+
+def _remember_miss(item_id: str, expires_at_ns: int, now_ns: int) -> None:
+    """
+    Record a negative-cache entry (FIFO by expiry, O(1) eviction).
+    Expired entries at the front are drained first, then the oldest live
+    entry is evicted only if the cache is still full.
+    """
+    with _MISS_LOCK:
+        while _DATA_MISS_CACHE and next(iter(_DATA_MISS_CACHE.values())) <= now_ns:
+            _DATA_MISS_CACHE.popitem(last=False)
+        if item_id in _DATA_MISS_CACHE:
+            _DATA_MISS_CACHE.move_to_end(item_id)
+        elif len(_DATA_MISS_CACHE) >= MAX_MISS_CACHE_ENTRIES:
+            _DATA_MISS_CACHE.popitem(last=False)
+        _DATA_MISS_CACHE[item_id] = expires_at_ns
+
+
+def _forget_miss(item_id: str) -> None:
+    """Drop a negative-cache entry (expired, or the ID now exists)."""
+    if item_id in _DATA_MISS_CACHE:
+        with _MISS_LOCK:
+            _DATA_MISS_CACHE.pop(item_id, None)
+
+
 def negotiate_language(accept_language_header: str) -> str:
     """
     Parse Accept-Language with q-values; try exact -> base -> DEFAULT_LANG.
     Keep client order for equal q-values.
     Honor q=0 as 'unacceptable' and skip such entries (RFC-consistent).
+
+    Regression cases (default config: SUPPORTED_LANGS=en,de,fr, DEFAULT_LANG=en,
+    MAX_LANG_ENTRIES=12); run with `python -m doctest main.py`:
+
+    >>> negotiate_language("de-DE,de;q=0.9,en;q=0.8")
+    'de'
+    >>> negotiate_language("")
+    'en'
+    >>> negotiate_language("fr;q=0,de")  # q=0 rejects fr
+    'de'
+    >>> negotiate_language("fr;Q=0,de")  # weight name is case-insensitive
+    'de'
+    >>> negotiate_language("de;Q=0.1,fr")
+    'fr'
+    >>> negotiate_language("fr;q=0, de;q=0")  # everything rejected -> default
+    'en'
+    >>> negotiate_language("de ; q=0.5, fr;q=0.4")  # whitespace around ";" / "="
+    'de'
+    >>> negotiate_language("fr-CA;q=abc, de;q=0.9")  # invalid weight -> q=1.0
+    'fr'
+    >>> negotiate_language("xx;q=,de;q=0.9")  # empty weight -> q=1.0, xx unsupported
+    'de'
+    >>> negotiate_language("a,,b, ,fr")  # blank elements are skipped, not counted
+    'fr'
+    >>> negotiate_language("a,b,c,d,e,f,g,h,i,j,k,fr")  # 12th entry is within the cap
+    'fr'
+    >>> negotiate_language("a,b,c,d,e,f,g,h,i,j,k,l,fr")  # 13th entry is dropped
+    'en'
+    >>> negotiate_language(";q=0.5,a,b,c,d,e,f,g,h,i,j,k,de")  # empty range still counts
+    'en'
     """
     if not accept_language_header:
         return DEFAULT_LANG
+    # Cap before caching so oversized headers cannot bloat the memo.
+    return _negotiate_language_cached(accept_language_header[:MAX_LANG_HEADER_LEN])
 
-    h = accept_language_header[:MAX_LANG_HEADER_LEN]
-    parts = [p.strip() for p in h.split(",") if p.strip()][:MAX_LANG_ENTRIES]
 
+def _q_sort_key(entry: Tuple[str, float, int]) -> Tuple[float, int]:
+    """Sort key for parsed (lang, q, position) entries: q DESC, then position ASC."""
+    return -entry[1], entry[2]
+
+
+@functools.lru_cache(maxsize=LANG_NEGOTIATION_CACHE_SIZE)
+def _negotiate_language_cached(h: str) -> str:
+    """
+    Memoized negotiation for a (length-capped) header.
+    Pure function of the header: SUPPORTED_LANGS/DEFAULT_LANG are fixed at import.
+    Call _negotiate_language_cached.cache_clear() after changing them at runtime.
+    """
     parsed: List[Tuple[str, float, int]] = []
-    for idx, p in enumerate(parts):
-        if ";q=" in p:
-            lang, q = p.split(";q=", 1)
+    for m in _ACCEPT_LANG_RE.finditer(h):
+        lang, q = m.groups()
+        if not lang and not m.group(0).lstrip(",").strip():
+            continue  # blank element (e.g. "a,,b"); non-blank ones count toward the cap
+        if q is None:
+            qv = 1.0
+        else:
             try:
                 qv = float(q)
             except ValueError:
                 qv = 1.0
-        else:
-            lang, qv = p, 1.0
-        parsed.append((lang.lower(), qv, idx))
+        parsed.append((lang.lower(), qv, len(parsed)))
+        if len(parsed) >= MAX_LANG_ENTRIES:
+            break
 
     # sort by q DESC, then original position ASC (stable tie-break)
-    parsed.sort(key=lambda x: (-x[1], x[2]))
+    parsed.sort(key=_q_sort_key)
 
     for lang, qv, _ in parsed:
         if qv <= 0.0:
@@ -130,19 +301,18 @@ def negotiate_language(accept_language_header: str) -> str:
             continue
         if lang in SUPPORTED_LANGS:
             return lang
-        if "-" in lang:
-            base = lang.split("-")[0]
-            if base in SUPPORTED_LANGS:
-                return base
+        base, sep, _ = lang.partition("-")
+        if sep and base in SUPPORTED_LANGS:
+            return base
     return DEFAULT_LANG
 
 
 def _normalize_lang_for_header(lang: str) -> str:
     """Return the language code suitable for Content-Language (prefer base)."""
-    return lang.split("-")[0] if "-" in lang else lang
+    return lang.partition("-")[0]
 
 
-def _std_headers(lang: str) -> Dict[str, str]:
+def _build_std_headers(lang: str) -> Dict[str, str]:
     """
     Standard headers for all responses:
       - Content-Type: JSON
@@ -158,50 +328,150 @@ def _std_headers(lang: str) -> Dict[str, str]:
     }
 
 
+# negotiate_language() only ever returns one of these, so header values are built once.
+_HEADERS_BY_LANG: Dict[str, Dict[str, str]] = {
+    lang: _build_std_headers(lang) for lang in SUPPORTED_LANGS | {DEFAULT_LANG}
+}
+
+
+def _std_headers(lang: str) -> Dict[str, str]:
+    """
+    Standard headers for lang as a new dict per response (callers may add headers),
+    copied from the precomputed table. Unknown languages get a freshly built dict
+    so Content-Language stays accurate.
+    """
+    headers = _HEADERS_BY_LANG.get(lang)
+    return dict(headers) if headers is not None else _build_std_headers(lang)
+
+
 def _path_for_i18n(lang: str) -> str:
     return f"{I18N_PREFIX}/{lang}.json"
 
 
+def _scan_i18n_langs() -> Optional[frozenset]:
+    """
+    Snapshot the language codes shipped in I18N_PREFIX (file stems of *.json).
+    Returns None (= unknown, always try the file) if rescans are requested or the
+    directory cannot be listed.
+    """
+    if I18N_RESCAN:
+        return None
+    try:
+        return frozenset(p[:-5] for p in os.listdir(I18N_PREFIX) if p.endswith(".json"))
+    except OSError:
+        return None
+
+
+# Languages with an i18n file; lets cold fallbacks skip open() on files that don't exist.
+_AVAILABLE_LANGS = _scan_i18n_langs()
+
+
 def _path_for_data(item_id: str) -> str:
     # ID validation blocks traversal and malformed names
     _validate_item_id(item_id)
     return f"{DATA_PREFIX}/{item_id}.json"
 
 
+def _read_file_bytes(path: str) -> bytes:
+    """
+    Read a whole (small) file with raw os calls: open + fstat + one sized read,
+    no buffered/text I/O layers. Falls back to reading until EOF on short reads
+    (or when st_size is 0, e.g. pseudo-files).
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        buf = os.read(fd, size) if size else b""
+        if size and len(buf) == size:
+            return buf
+        chunks = [buf]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
 def _load_json_file(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    raw = _read_file_bytes(path)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _dump_json(obj: Any) -> str:
+    """Serialize to a compact JSON string (UTF-8 characters kept as-is)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _intern_keys(mapping: dict) -> dict:
+    """
+    Rebuild a freshly loaded map with interned string keys. Descriptions, units and
+    data share key names, so lookups across the three maps hit dict's identity
+    fast path instead of comparing strings.
+    """
+    return {(sys.intern(k) if isinstance(k, str) else k): v for k, v in mapping.items()}
+
+
+# Returned by the _get_* loaders with load=False when the answer is not cached
+# (i.e. a file would have to be read).
+_NOT_CACHED: Any = object()
 
 
 # --- I18N (descriptions) ---
 def get_descriptions(lang: str) -> dict:
     """
     Lazy-load descriptions with cache. Fallback: requested -> base -> default.
-    Uses thread-safe writes and monotonic TTL checks.
+    Uses GIL-atomic cache writes and monotonic TTL checks.
     """
-    now_mono = time.monotonic()
+    return _get_descriptions(lang, time.monotonic_ns())
 
+
+def _get_descriptions(lang: str, now_ns: int, load: bool = True) -> dict:
+    """
+    get_descriptions() with a caller-supplied monotonic timestamp.
+    With load=False, only consult the cache and return _NOT_CACHED instead of reading.
+    """
+    # Common case first: the requested language itself is cached and fresh
+    stamp = _DESC_STAMP.get(lang)
+    if stamp is not None and now_ns - stamp < DESC_CACHE_TTL_NS:
+        return _DESC_DATA[lang]
+
+    base, sep, _ = lang.partition("-")
     tried = set()
-    for candidate in (lang, lang.split("-")[0] if "-" in lang else None, DEFAULT_LANG):
+    for candidate in (lang, base if sep else None, DEFAULT_LANG):
         if not candidate or candidate in tried:
             continue
         tried.add(candidate)
 
-        entry = _DESC_CACHE.get(candidate)
-        if cache_fresh(entry, DESC_CACHE_TTL_SECONDS, now_mono):
-            return entry["data"]
+        stamp = _DESC_STAMP.get(candidate)
+        if stamp is not None and now_ns - stamp < DESC_CACHE_TTL_NS:
+            return _DESC_DATA[candidate]
+
+        if _AVAILABLE_LANGS is not None and candidate not in _AVAILABLE_LANGS:
+            continue  # no file shipped for this language
+
+        if not load:
+            return _NOT_CACHED
 
         try:
             data = _load_json_file(_path_for_i18n(candidate))
             if not isinstance(data, dict):
                 raise ValueError(f"i18n file must be an object/map, got {type(data)}")
-            # Lock around writes to avoid torn updates under concurrent access.
-            with _DESC_LOCK:
-                _DESC_CACHE[candidate] = {"data": data, "loaded_at_mono": now_mono}
+            data = _intern_keys(data)
+            # Single-key assignments are atomic; payload first, then stamp.
+            _DESC_DATA[candidate] = data
+            _DESC_STAMP[candidate] = now_ns
             return data
         except FileNotFoundError:
             continue
 
+    if not load:
+        return _NOT_CACHED
     raise RuntimeError("No available descriptions for requested/default languages")
 
 
@@ -211,23 +481,34 @@ def get_units_map() -> dict:
     Load units from a single JSON file, cache with its own TTL.
     File shape: { "key1": "m", "key2": "kg", ... }
     """
-    now_mono = time.monotonic()
-    entry = _UNITS_CACHE.get("units")
-    if cache_fresh(entry, UNITS_CACHE_TTL_SECONDS, now_mono):
-        return entry["units"]
+    return _get_units_map(time.monotonic_ns())
+
+
+def _get_units_map(now_ns: int, load: bool = True) -> dict:
+    """
+    get_units_map() with a caller-supplied monotonic timestamp.
+    With load=False, only consult the cache and return _NOT_CACHED instead of reading.
+    """
+    stamp = _UNITS_STAMP.get("units")
+    if stamp is not None and now_ns - stamp < UNITS_CACHE_TTL_NS:
+        return _UNITS_DATA["units"]
+    if not load:
+        return _NOT_CACHED
 
     try:
         units = _load_json_file(UNITS_FILE)
         if not isinstance(units, dict):
             raise ValueError(f"units file must be an object/map, got {type(units)}")
-        with _UNITS_LOCK:  # thread-safe write
-            _UNITS_CACHE["units"] = {"units": units, "loaded_at_mono": now_mono}
+        units = _intern_keys(units)
+        _UNITS_DATA["units"] = units
+        _UNITS_STAMP["units"] = now_ns
         return units
     except FileNotFoundError:
         # No units file -> still respond; unit fields will be null
-        with _UNITS_LOCK:
-            _UNITS_CACHE["units"] = {"units": {}, "loaded_at_mono": now_mono}
-        return {}
+        units = {}
+        _UNITS_DATA["units"] = units
+        _UNITS_STAMP["units"] = now_ns
+        return units
 
 
 # --- Data per ID (with negative cache + bounded caches) ---
@@ -237,16 +518,32 @@ def get_data_map(item_id: str) -> Optional[dict]:
     File shape: { "id": "...", "data": { ... } }
     Negative-cache 404s to avoid repeated disk hits.
     """
-    now_mono = time.monotonic()
+    return _get_data_map(item_id, time.monotonic_ns())
 
+
+def _get_data_map(item_id: str, now_ns: int, load: bool = True) -> Optional[dict]:
+    """
+    get_data_map() with a caller-supplied monotonic timestamp.
+    With load=False, only consult the caches and return _NOT_CACHED instead of reading.
+    """
     # Negative cache: if we recently saw a miss for this id, return fast
     miss_exp = _DATA_MISS_CACHE.get(item_id)
-    if miss_exp and miss_exp > now_mono:
-        return None
-
-    entry = _DATA_CACHE.get(item_id)
-    if cache_fresh(entry, DATA_CACHE_TTL_SECONDS, now_mono):
-        return entry["data_map"]
+    if miss_exp is not None:
+        if miss_exp > now_ns:
+            return None
+        if not load:
+            return _NOT_CACHED  # leave the expired entry to the loading call
+        _forget_miss(item_id)
+
+    stamp = _DATA_STAMP.get(item_id)
+    if stamp is not None and now_ns - stamp < DATA_CACHE_TTL_NS:
+        # .get(): a concurrent eviction may drop the payload after the stamp check
+        data_map = _DATA_MAPS.get(item_id)
+        if data_map is not None:
+            return data_map
+
+    if not load:
+        return _NOT_CACHED
 
     try:
         raw = _load_json_file(_path_for_data(item_id))
@@ -256,45 +553,84 @@ def get_data_map(item_id: str) -> Optional[dict]:
         data_map = raw.get("data") or {}
         if not isinstance(data_map, dict):
             raise ValueError(f"'data' must be an object/map, got {type(data_map)}")
+        data_map = _intern_keys(data_map)
 
-        _bounded_put(
-            _DATA_CACHE,
+        _bounded_put_stamped(
+            _DATA_MAPS,
+            _DATA_STAMP,
             item_id,
-            {"data_map": data_map, "loaded_at_mono": now_mono},
+            data_map,
+            now_ns,
             MAX_DATA_CACHE_ENTRIES,
             _DATA_LOCK,
         )
         # clear negative cache on hit
-        if item_id in _DATA_MISS_CACHE:
-            with _MISS_LOCK:
-                _DATA_MISS_CACHE.pop(item_id, None)
+        _forget_miss(item_id)
         return data_map
 
     except FileNotFoundError:
-        # remember miss briefly (min(60s, DATA_CACHE_TTL_SECONDS))
-        _bounded_put(
-            _DATA_MISS_CACHE,
-            item_id,
-            now_mono + min(60, DATA_CACHE_TTL_SECONDS),
-            MAX_MISS_CACHE_ENTRIES,
-            _MISS_LOCK,
-        )
+        # remember miss briefly (MISS_CACHE_TTL_NS)
+        _remember_miss(item_id, now_ns + MISS_CACHE_TTL_NS, now_ns)
         return None
 
 
+def _load_sources_inline(
+    lang: str, item_id: str, now_ns: int
+) -> Tuple[dict, dict, Optional[dict]]:
+    """Return (descriptions, units, values) for a request, loading cold sources inline."""
+    return (
+        _get_descriptions(lang, now_ns),
+        _get_units_map(now_ns),
+        _get_data_map(item_id, now_ns),
+    )
+
+
+def _load_sources_concurrent(
+    lang: str, item_id: str, now_ns: int
+) -> Tuple[dict, dict, Optional[dict]]:
+    """
+    Like _load_sources_inline(), but if two or more sources need a disk load, run
+    those loads on _IO_POOL so cold latency is ~max(loads) rather than their sum.
+    """
+    descriptions = _get_descriptions(lang, now_ns, load=False)
+    units_map = _get_units_map(now_ns, load=False)
+    values_map = _get_data_map(item_id, now_ns, load=False)
+    desc_cold = descriptions is _NOT_CACHED
+    units_cold = units_map is _NOT_CACHED
+    data_cold = values_map is _NOT_CACHED
+
+    if desc_cold + units_cold + data_cold >= 2:
+        f_desc = _IO_POOL.submit(_get_descriptions, lang, now_ns) if desc_cold else None
+        f_units = _IO_POOL.submit(_get_units_map, now_ns) if units_cold else None
+        f_data = _IO_POOL.submit(_get_data_map, item_id, now_ns) if data_cold else None
+        if f_desc:
+            descriptions = f_desc.result()
+        if f_units:
+            units_map = f_units.result()
+        if f_data:
+            values_map = f_data.result()
+    # warm, or a single load: a thread hop would only add overhead
+    elif desc_cold:
+        descriptions = _get_descriptions(lang, now_ns)
+    elif units_cold:
+        units_map = _get_units_map(now_ns)
+    elif data_cold:
+        values_map = _get_data_map(item_id, now_ns)
+    return descriptions, units_map, values_map
+
+
+# Specialize once at import, like _output_keys below.
+_load_sources = _load_sources_concurrent if CONCURRENT_COLD_LOADS else _load_sources_inline
+
+
 def _determine_output_keys(
     descriptions: dict, values_map: dict, units_map: dict
 ) -> List[str]:
     """
-    Decide which keys to output and in what order.
-    Priority:
-      1) CANON_KEYS (if provided)
-      2) All description keys, then any extra keys from values_map, then any extra from units_map
-         (stable, alphabetical within each group)
+    Decide which keys to output and in what order (used when CANON_KEYS is not set):
+    all description keys, then any extra keys from values_map, then any extra from units_map
+    (stable, alphabetical within each group)
     """
-    if CANON_KEYS:
-        return CANON_KEYS
-
     desc_keys = set(descriptions.keys())
     val_keys = set(values_map.keys())
     unit_keys = set(units_map.keys())
@@ -304,6 +640,74 @@ def _determine_output_keys(
     return first + second + third
 
 
+def _cached_output_keys(
+    descriptions: dict, values_map: dict, units_map: dict
+) -> Tuple[str, ...]:
+    """
+    _determine_output_keys() memoized per descriptions/units map (by identity; a
+    reload replaces the object) and per *key set* of values_map, so all items
+    sharing a key set reuse one canonical keys tuple.
+    """
+    k = (id(descriptions), frozenset(values_map), id(units_map))
+    cached = _KEYS_CACHE.get(k)
+    if cached is not None:
+        return cached[2]
+    keys = tuple(_determine_output_keys(descriptions, values_map, units_map))
+    _bounded_put(
+        _KEYS_CACHE,
+        k,
+        (descriptions, units_map, keys),
+        MAX_KEYS_CACHE_ENTRIES,
+        _KEYS_LOCK,
+    )
+    return keys
+
+
+def _canon_output_keys(
+    descriptions: dict, values_map: dict, units_map: dict
+) -> Tuple[str, ...]:
+    """Fixed ordering from CANON_KEYS, independent of the source maps."""
+    return CANON_KEYS
+
+
+def _attribute_template(
+    descriptions: dict, units_map: dict, keys: Tuple[str, ...]
+) -> List[Tuple[str, Any, Any]]:
+    """
+    Per-language (key, description, unit) rows for the given key order, memoized on
+    the descriptions/units maps (by identity) and the key order (by content); only
+    the per-ID value is filled in per request.
+    """
+    k = (id(descriptions), id(units_map), keys)
+    cached = _TEMPLATE_CACHE.get(k)
+    if cached is not None:
+        return cached[2]
+    # None if missing in language / no unit defined
+    template = [(key, descriptions.get(key), units_map.get(key)) for key in keys]
+    _bounded_put(
+        _TEMPLATE_CACHE,
+        k,
+        (descriptions, units_map, template),
+        MAX_TEMPLATE_CACHE_ENTRIES,
+        _TEMPLATE_LOCK,
+    )
+    return template
+
+
+# Specialize once at import: CANON_KEYS is fixed config, so main() never branches on it.
+_output_keys = _canon_output_keys if CANON_KEYS else _cached_output_keys
+
+
+@functools.lru_cache(maxsize=ERROR_BODY_CACHE_SIZE)
+def _static_error_body(code: int, message: str) -> str:
+    """
+    Serialized body for an error without correlation id. Only meant for the fixed
+    400/404 messages (a handful of (code, message) pairs); each is encoded once.
+    500 bodies carry a unique correlation id and are built per call instead.
+    """
+    return _dump_json({"code": code, "message": message})
+
+
 def _error_response(
     status: int,
     lang: str,
@@ -311,13 +715,14 @@ def _error_response(
     message: str,
     correlation_id: Optional[str] = None,
 ):
-    payload = {"code": code, "message": message}
     if correlation_id:
-        payload["correlation_id"] = correlation_id
+        body = _dump_json({"code": code, "message": message, "correlation_id": correlation_id})
+    else:
+        body = _static_error_body(code, message)
     return {
         "statusCode": status,
         "headers": _std_headers(lang),
-        "body": json.dumps(payload, ensure_ascii=False),
+        "body": body,
     }
 
 
@@ -333,46 +738,91 @@ def main(item_id: str, accept_language: str):
         except ValueError as e:
             return _error_response(400, lang, 400, str(e))
 
-        descriptions = get_descriptions(lang)
-        units_map = get_units_map()
-        values_map = get_data_map(item_id)
+        # One clock read shared by all three cache lookups
+        now_ns = time.monotonic_ns()
+        descriptions, units_map, values_map = _load_sources(lang, item_id, now_ns)
 
         if values_map is None:
             return _error_response(404, lang, 404, "not found")
 
-        keys = _determine_output_keys(descriptions, values_map, units_map)
-
-        list_attr = []
-        for k in keys:
-            list_attr.append(
-                {
-                    "key": k,
-                    "description": descriptions.get(k),  # None if missing in language
-                    "value": values_map.get(k),  # None if missing for this id
-                    "unit": units_map.get(k),  # None if no unit defined
-                }
+        # Warm hit: all three source maps are unchanged -> reuse the serialized body.
+        # A reload replaces the cached map object, which changes the key.
+        cache_key = (item_id, lang, id(descriptions), id(units_map), id(values_map))
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            return {
+                "statusCode": 200,
+                "headers": _std_headers(lang),
+                "body": cached[3],
+            }
+
+        keys = _output_keys(descriptions, values_map, units_map)
+        template = _attribute_template(descriptions, units_map, keys)
+
+        list_attr = [
+            # value is None if missing for this id
+            {"key": k, "description": d, "value": values_map.get(k), "unit": u}
+            for k, d, u in template
+        ]
+
+        # Fixed response shape: template the outer object and only run the encoder on
+        # the variable parts. item_id is validated [a-z0-9]{4}, so it is JSON-safe as-is.
+        body = "".join(
+            (
+                '{"id":"',
+                item_id,
+                '","language":',
+                _dump_json(_normalize_lang_for_header(lang)),
+                ',"list-attribute":',
+                _dump_json(list_attr),
+                "}",
             )
-
-        response = {
-            "id": item_id,
-            "language": _normalize_lang_for_header(lang),
-            "list-attribute": list_attr,
-        }
+        )
+        _bounded_put(
+            _RESPONSE_CACHE,
+            cache_key,
+            (descriptions, units_map, values_map, body),
+            MAX_RESPONSE_CACHE_ENTRIES,
+            _RESPONSE_LOCK,
+        )
 
         return {
             "statusCode": 200,
             "headers": _std_headers(lang),
-            "body": json.dumps(response, ensure_ascii=False),
+            "body": body,
         }
 
     except Exception as ex:
         # Log the exception server-side (visible in CloudWatch for Lambda)
-        correlation_id = str(uuid.uuid4())
+        correlation_id = os.urandom(8).hex()  # 64 random bits, 16 hex chars
         print(f"[ERROR] correlation_id={correlation_id} item_id={item_id} lang={lang} error={ex}")
         # Generic 500 to client with correlation id
         return _error_response(500, lang, 500, "internal server error", correlation_id)
 
 
+def _preload_static_files() -> None:
+    """
+    Warm the descriptions (every supported language + default) and units caches.
+    Failures are logged and left to the lazy path, so a bad file surfaces as a
+    request error rather than an import error.
+    """
+    now_ns = time.monotonic_ns()
+    for lang in sorted(SUPPORTED_LANGS | {DEFAULT_LANG}):
+        try:
+            _get_descriptions(lang, now_ns)
+        except Exception as ex:
+            print(f"[WARN] preload failed lang={lang} error={ex}")
+    try:
+        if os.path.exists(UNITS_FILE):  # a missing file is handled (and cached) lazily
+            _get_units_map(now_ns)
+    except Exception as ex:
+        print(f"[WARN] preload failed units_file={UNITS_FILE} error={ex}")
+
+
+if PRELOAD_I18N:
+    _preload_static_files()
+
+
 if __name__ == "__main__":
     # Local test
     print(main("id01", "de-DE,de;q=0.9,en;q=0.8"))